@@ -1,28 +1,56 @@
 
 from __future__ import annotations
-import os, json, time, threading, re
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+import os, time, threading, re, functools, operator, random, copy
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Tuple
+import orjson
 from flask import Flask, render_template, request, redirect, url_for, abort, make_response
+from flask.json.provider import JSONProvider
+try:
+    import re2  # optional: linear-time regex engine for short answers
+except ImportError:
+    re2 = None
+
+_ORJSON_OPT = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    # route Flask's own JSON handling (jsonify, request.get_json) through orjson
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
 APP = Flask(__name__)
+APP.json = OrjsonProvider(APP)
 # expose Python's enumerate to Jinja templates
 APP.jinja_env.globals.update(enumerate=enumerate)
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 os.makedirs(DATA_DIR, exist_ok=True)
 STATE_FILE = os.path.join(DATA_DIR, "state.json")
+_EVENT_LOG = STATE_FILE + ".log"  # submits since the last snapshot, one JSON object per line
+SNAPSHOT_EVERY = 200
 QUESTIONS_FILE = os.path.join(os.path.dirname(__file__), "questions.json")
 
 ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")  # optional
 
 # ---------------- Models ----------------
-@dataclass
+@functools.lru_cache(None)
+def _field_names(cls) -> tuple:
+    return tuple(f.name for f in fields(cls) if f.metadata.get("serialize", True))
+
+def _flat(obj) -> dict:
+    # shallow field mapping; unlike asdict() it does not deep-copy values
+    names = _field_names(type(obj))
+    return {n: getattr(obj, n) for n in names}
+
+@dataclass(slots=True)
 class Team:
     id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     id: str
     kind: str  # "single" | "multi" | "short"
@@ -32,50 +60,50 @@ class Question:
     choices: List[str] = field(default_factory=list)
     answer: Any = None  # single: int; multi: List[int]; short: List[str] (regex)
     explanation: str = ""
+    # answer in matchable form (short: compiled regexes, multi: frozenset), built at load time and never persisted
+    _compiled: Any = field(default=None, repr=False, compare=False, metadata={"serialize": False})
+    _human: Optional[str] = field(default=None, repr=False, compare=False, metadata={"serialize": False})
 
-@dataclass
+@dataclass(slots=True)
 class Answer:
     choice: Optional[int] = None
     choices: Optional[List[int]] = None
     text: Optional[str] = None
     correct: Optional[bool] = None
 
-@dataclass
+@dataclass(slots=True)
 class RoundState:
     qidx: int = 0
     revealed: bool = False
     neg_mark: bool = False
     timer_secs: int = 60
     deadline: Optional[float] = None  # epoch seconds
-    submissions: Dict[str, Dict[int, Answer]] = field(default_factory=dict)
+    submissions: Dict[Tuple[str, int], Answer] = field(default_factory=dict)  # (team id, qidx) -> answer
     scores: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class RootState:
     teams: Dict[str, Team] = field(default_factory=dict)
     questions: List[Question] = field(default_factory=list)
     rnd: RoundState = field(default_factory=RoundState)
+    # bumped on every mutation; keys the rendered-page cache
+    _rev: int = field(default=0, repr=False, compare=False, metadata={"serialize": False})
+    _n_q: int = field(default=0, repr=False, compare=False, metadata={"serialize": False})  # len(questions)
+    # sequence number of the last logged event; snapshots record it so replay
+    # skips events they already contain. Unlike _rev/_n_q it is persisted, as
+    # the top-level "log_seq" key written by write_snapshot, hence no
+    # serialize=False marker.
+    _log_seq: int = field(default=0, repr=False, compare=False)
 
-    def to_json(self) -> dict:
-        return {
-            "teams": {k: asdict(v) for k,v in self.teams.items()},
-            "questions": [asdict(q) for q in self.questions],
-            "rnd": {
-                "qidx": self.rnd.qidx,
-                "revealed": self.rnd.revealed,
-                "neg_mark": self.rnd.neg_mark,
-                "timer_secs": self.rnd.timer_secs,
-                "deadline": self.rnd.deadline,
-                "submissions": {tid: {str(i): asdict(ans) for i, ans in qs.items()} for tid, qs in self.rnd.submissions.items()},
-                "scores": self.rnd.scores,
-            }
-        }
+    def set_questions(self, qs: List[Question]) -> None:
+        self.questions = qs
+        self._n_q = len(qs)
 
     @staticmethod
     def from_json(d: dict) -> "RootState":
         st = RootState()
         st.teams = {k: Team(**v) for k, v in d.get("teams", {}).items()}
-        st.questions = [Question(**q) for q in d.get("questions", [])]
+        st.set_questions(compile_answers([Question(**q) for q in d.get("questions", [])]))
         rnd = d.get("rnd", {})
         rs = RoundState(
             qidx = rnd.get("qidx", 0),
@@ -83,64 +111,200 @@ class RootState:
             neg_mark = rnd.get("neg_mark", False),
             timer_secs = rnd.get("timer_secs", 60),
             deadline = rnd.get("deadline"),
-            submissions = {tid: {int(i): Answer(**ans) for i, ans in qs.items()} for tid, qs in rnd.get("submissions", {}).items()},
+            submissions = _submissions_from_json(rnd.get("submissions", {})),
             scores = rnd.get("scores", {}),
         )
         st.rnd = rs
+        st._log_seq = d.get("log_seq", 0)
         return st
 
+def _submissions_from_json(d: dict) -> Dict[Tuple[str, int], Answer]:
+    subs = {}
+    for k, v in d.items():
+        if "|" in k:
+            tid, i = k.rsplit("|", 1)
+            subs[(tid, int(i))] = Answer(**v)
+        else:
+            # older snapshots nest answers per team: {tid: {qidx: answer}}
+            for i, ans in v.items():
+                subs[(k, int(i))] = Answer(**ans)
+    return subs
+
 LOCK = threading.Lock()
 STATE: Optional[RootState] = None
+_LOG_FH = None  # append handle on _EVENT_LOG, opened lazily
+_LOG_COUNT = 0
 
 # ---------------- Helpers ----------------
 def load_questions() -> List[Question]:
-    with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [Question(**q) for q in data]
+    with open(QUESTIONS_FILE, "rb") as f:
+        data = orjson.loads(f.read())
+    return compile_answers([Question(**q) for q in data])
+
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+# classes RE2 matches as ASCII only, where str patterns in re match Unicode
+_UNICODE_CLASSES = re.compile(r"\\[sdwbSDWB]")
+
+def compile_short(patterns: List[str]) -> tuple:
+    # each pattern is compiled on its own first, so errors match trying them
+    # one by one
+    compiled = tuple(re.compile(rx, re.IGNORECASE) for rx in patterns)
+    # an alternation renumbers groups (breaking backreferences) and rejects
+    # global inline flags after the first branch; keep those patterns separate
+    if len(compiled) < 2 or any(p.groups or _GLOBAL_FLAGS.match(p.pattern) for p in compiled):
+        return compiled
+    union = "|".join(f"(?:{rx})" for rx in patterns)
+    # RE2 only where it accepts exactly what re would
+    if re2 is not None and not any(_UNICODE_CLASSES.search(rx) for rx in patterns):
+        try:
+            return (re2.compile("(?i)" + union),)
+        except Exception:
+            pass  # syntax RE2 does not support
+    return (re.compile(union, re.IGNORECASE),)
+
+def compile_answers(qs: List[Question]) -> List[Question]:
+    for q in qs:
+        if q.kind == "short":
+            q._compiled = compile_short(q.answer or [])
+        elif q.kind == "multi":
+            q._compiled = frozenset(q.answer or [])
+    return qs
 
 def load_state() -> RootState:
     if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
-            return RootState.from_json(json.load(f))
+        with open(STATE_FILE, "rb") as f:
+            st = RootState.from_json(orjson.loads(f.read()))
+        if os.path.exists(_EVENT_LOG):
+            replay_events(st)
+            # fold the log into a fresh snapshot; this also drops a torn tail
+            # that later appends would otherwise be glued onto
+            save_state(st)
+        return st
     st = RootState()
     for name in ["Alpha","Bravo","Charlie","Delta","Echo","Foxtrot"]:
         tid = name.lower()
         st.teams[tid] = Team(id=tid, name=name)
-        st.rnd.submissions[tid] = {}
         st.rnd.scores[tid] = 0.0
-    st.questions = load_questions()
+    st.set_questions(load_questions())
     save_state(st)
     return st
 
+def write_snapshot(f, st: RootState) -> None:
+    # the snapshot format read back by RootState.from_json, serialized section
+    # by section so the whole state never exists as one Python dict
+    rnd = st.rnd
+    f.write(b'{\n"log_seq": ' + orjson.dumps(st._log_seq))
+    f.write(b',\n"teams": ')
+    f.write(orjson.dumps({k: _flat(v) for k, v in st.teams.items()}, option=_ORJSON_OPT))
+    f.write(b',\n"questions": ')
+    f.write(orjson.dumps([_flat(q) for q in st.questions], option=_ORJSON_OPT))
+    head = orjson.dumps({
+        "qidx": rnd.qidx,
+        "revealed": rnd.revealed,
+        "neg_mark": rnd.neg_mark,
+        "timer_secs": rnd.timer_secs,
+        "deadline": rnd.deadline,
+    })
+    f.write(b',\n"rnd": ' + head[:-1] + b',\n"submissions": {')
+    sep = b"\n"
+    for (tid, i), ans in rnd.submissions.items():
+        f.write(sep + orjson.dumps(f"{tid}|{i}") + b": " + orjson.dumps(_flat(ans)))
+        sep = b",\n"
+    f.write(b'},\n"scores": ')
+    f.write(orjson.dumps(rnd.scores, option=_ORJSON_OPT))
+    f.write(b"}\n}\n")
+
 def save_state(st: RootState) -> None:
     tmp = STATE_FILE + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(st.to_json(), f, indent=2)
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        write_snapshot(f, st)
     os.replace(tmp, STATE_FILE)
+    # the snapshot now covers everything logged so far
+    global _LOG_FH, _LOG_COUNT
+    if _LOG_FH is not None:
+        _LOG_FH.close()
+    _LOG_FH = open(_EVENT_LOG, "wb")
+    _LOG_COUNT = 0
+
+def log_event(st: RootState, ev: dict) -> None:
+    global _LOG_FH, _LOG_COUNT
+    if _LOG_FH is None:
+        _LOG_FH = open(_EVENT_LOG, "ab")
+    st._log_seq += 1
+    ev["seq"] = st._log_seq
+    _LOG_FH.write(orjson.dumps(ev) + b"\n")
+    _LOG_FH.flush()
+    _LOG_COUNT += 1
+    if _LOG_COUNT >= SNAPSHOT_EVERY:
+        save_state(st)
+
+def apply_submit(st: RootState, team_id: str, qidx: int, ans: Answer) -> None:
+    st.rnd.submissions[(team_id, qidx)] = ans
+
+_REPLAY = {
+    "submit": lambda st, ev: apply_submit(st, ev["team"], ev["q"], Answer(**ev["ans"])),
+}
+
+def replay_events(st: RootState) -> int:
+    if not os.path.exists(_EVENT_LOG):
+        return 0
+    n = 0
+    with open(_EVENT_LOG, "rb") as f:
+        for line in f:
+            try:
+                ev = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                break  # torn final write
+            seq = ev.get("seq")
+            if seq is not None:
+                if seq <= st._log_seq:
+                    continue  # already in the snapshot (crash before the log was truncated)
+                st._log_seq = seq
+            _REPLAY[ev["t"]](st, ev)
+            n += 1
+    return n
 
 def current_question(st: RootState) -> Optional[Question]:
-    if not st.questions:
-        return None
-    if st.rnd.qidx < 0 or st.rnd.qidx >= len(st.questions):
+    if st.rnd.qidx < 0 or st.rnd.qidx >= st._n_q:
         return None
     return st.questions[st.rnd.qidx]
 
+def _eval_single(q: Question, ans: Answer) -> bool:
+    return ans.choice is not None and int(ans.choice) == int(q.answer)
+
+def _eval_multi(q: Question, ans: Answer) -> bool:
+    if q._compiled is None:
+        compile_answers([q])
+    return set(ans.choices or []) == q._compiled
+
+def _eval_short(q: Question, ans: Answer) -> bool:
+    text = (ans.text or "").strip()
+    if q._compiled is None:
+        compile_answers([q])
+    return any(p.fullmatch(text) for p in q._compiled)
+
+# one checker per question kind, picked with a single dict lookup
+_EVALUATORS = {"single": _eval_single, "multi": _eval_multi, "short": _eval_short}
+
 def eval_answer(q: Question, ans: Answer) -> bool:
-    if q.kind == "single":
-        return ans.choice is not None and int(ans.choice) == int(q.answer)
-    if q.kind == "multi":
-        correct = set(q.answer or [])
-        got = set(ans.choices or [])
-        return got == correct
-    if q.kind == "short":
-        text = (ans.text or "").strip()
-        for rx in (q.answer or []):
-            if re.fullmatch(rx, text, flags=re.IGNORECASE):
-                return True
-        return False
+    fn = _EVALUATORS.get(q.kind)
+    return fn(q, ans) if fn else False
+
+def _has_answer(ans: Answer, kind: str) -> bool:
+    if kind == "single":
+        return ans.choice is not None
+    if kind == "multi":
+        return bool(ans.choices)
+    if kind == "short":
+        return bool(ans.text)
     return False
 
 def human_answer(q: Question) -> str:
+    if q._human is None:
+        q._human = _human_answer(q)
+    return q._human
+
+def _human_answer(q: Question) -> str:
     if q.kind in ("single","multi"):
         if not q.choices:
             return ""
@@ -161,17 +325,24 @@ def human_answer(q: Question) -> str:
 
 def board(st: RootState):
     rows = []
+    scores = st.rnd.scores
+    answered = dict.fromkeys(st.teams, 0)
+    correct = dict.fromkeys(st.teams, 0)
+    for (tid, _), a in st.rnd.submissions.items():
+        if tid in answered:
+            answered[tid] += 1
+            if a.correct is True:
+                correct[tid] += 1
     for tid, team in st.teams.items():
-        subs = st.rnd.submissions.get(tid, {})
-        answered = len([i for i in subs if isinstance(subs[i], Answer)])
-        correct = len([i for i in subs if subs[i].correct is True])
+        points = round(scores.get(tid, 0.0), 2)
         rows.append({
             "team": team,
-            "points": round(st.rnd.scores.get(tid, 0.0), 2),
-            "answered": answered,
-            "correct": correct,
+            "points": points,
+            "answered": answered[tid],
+            "correct": correct[tid],
+            "_sortkey": (-points, team.name),
         })
-    rows.sort(key=lambda r: (-r["points"], r["team"].name))
+    rows.sort(key=operator.itemgetter("_sortkey"))
     return rows
 
 def is_local_request() -> bool:
@@ -194,8 +365,61 @@ def allowed_reset() -> bool:
     # Otherwise, only allow from localhost
     return is_local_request()
 
+_PAGE_CACHE: Dict[tuple, str] = {}
+
+def cached_page(view):
+    # serve the last render of a read-only page until STATE._rev moves on
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        with LOCK:
+            rev = STATE._rev
+            key = (request.path, rev)
+            html = _PAGE_CACHE.get(key)
+        if html is not None:
+            return html
+        html = view(*args, **kwargs)
+        with LOCK:
+            if _PAGE_CACHE and next(iter(_PAGE_CACHE))[1] != STATE._rev:
+                _PAGE_CACHE.clear()
+            if rev == STATE._rev:
+                _PAGE_CACHE[key] = html
+        return html
+    return wrapper
+
+def _is_int(v) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+def read_submission():
+    """Return (choice, choices, text) from a form post or a JSON body."""
+    if request.mimetype == "application/json":
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            abort(400)
+        if not isinstance(data, dict):
+            abort(400)
+        choice = data.get("choice")
+        # only a missing key or null means "empty"; other falsy values are mistyped
+        choices = data.get("choices")
+        if choices is None:
+            choices = []
+        text = data.get("text")
+        if text is None:
+            text = ""
+        # only hand on the shapes a form post could produce (plus plain ints)
+        if not (choice is None or isinstance(choice, str) or _is_int(choice)):
+            abort(400)
+        if not isinstance(choices, list) or not all(isinstance(c, str) or _is_int(c) for c in choices):
+            abort(400)
+        if not isinstance(text, str):
+            abort(400)
+        return choice, choices, text
+    form = request.form
+    return form.get("choice"), form.getlist("choices"), form.get("text", "")
+
 # ---------------- Routes ----------------
 @APP.route("/")
+@cached_page
 def index():
     with LOCK:
         st = STATE
@@ -203,11 +427,12 @@ def index():
     return render_template("index.html", board=b)
 
 @APP.route("/teams")
+@cached_page
 def teams():
     with LOCK:
         st = STATE
         teams = list(st.teams.values())
-        scores = st.rnd.scores
+        scores = dict(st.rnd.scores)
     return render_template("teams.html", teams=teams, scores=scores)
 
 @APP.route("/t/<team_id>", methods=["GET"])
@@ -218,17 +443,18 @@ def team_page(team_id):
         if not team: abort(404)
         q = current_question(st)
         qidx = st.rnd.qidx
-        total = len(st.questions)
-        subs = st.rnd.submissions.get(team_id, {})
-        current = subs.get(qidx)
+        total = st._n_q
+        current = copy.copy(st.rnd.submissions.get((team_id, qidx)))
         revealed = st.rnd.revealed
         answer_h = human_answer(q) if (q and revealed) else None
-        submitted = len([1 for t, byq in st.rnd.submissions.items() if byq.get(qidx)])
+        submitted = sum(1 for tid in st.teams if (tid, qidx) in st.rnd.submissions)
         deadline = st.rnd.deadline
     return render_template("team.html", team=team, q=q, qidx=qidx, total=total, current=current, revealed=revealed, answer_human=answer_h, submitted=submitted, deadline=deadline, msg=None)
 
 @APP.route("/t/<team_id>/submit", methods=["POST"])
 def submit_answer(team_id):
+    # parse the request body before taking the lock; only the state update is serialized
+    choice, choices, text = read_submission()
     with LOCK:
         st = STATE
         team = st.teams.get(team_id)
@@ -239,46 +465,62 @@ def submit_answer(team_id):
             return redirect(url_for('team_page', team_id=team_id))
         ans = Answer()
         if q.kind == "single":
-            choice = request.form.get("choice")
-            ans.choice = int(choice) if choice is not None else None
+            if isinstance(choice, str):
+                # isdigit() alone accepts e.g. "²", which int() rejects
+                choice = int(choice) if choice.isascii() and choice.isdigit() else None
+            ans.choice = choice if _is_int(choice) else None
         elif q.kind == "multi":
-            choices = request.form.getlist("choices")
-            ans.choices = [int(c) for c in choices]
+            if len(choices) > len(q.choices):
+                abort(400)
+            try:
+                ans.choices = list(map(int, choices))
+            except ValueError:
+                abort(400)
         elif q.kind == "short":
-            ans.text = request.form.get("text","").strip()
-        st.rnd.submissions.setdefault(team_id, {})[st.rnd.qidx] = ans
-        save_state(st)
+            ans.text = text.strip()
+        # resubmitting the same answer changes nothing; skip the log write
+        if st.rnd.submissions.get((team_id, st.rnd.qidx)) != ans:
+            apply_submit(st, team_id, st.rnd.qidx, ans)
+            st._rev += 1
+            log_event(st, {"t": "submit", "team": team_id, "q": st.rnd.qidx, "ans": _flat(ans)})
     return redirect(url_for('team_page', team_id=team_id))
 
 @APP.route("/facilitator", methods=["GET","POST"])
 def facilitator():
+    form = request.form
     with LOCK:
         st = STATE
         blocked = False
         if request.method == "POST":
-            action = request.form.get("action")
-            st.rnd.neg_mark = bool(request.form.get("neg")) or st.rnd.neg_mark
+            action = form.get("action")
+            neg_mark = bool(form.get("neg")) or st.rnd.neg_mark
+            dirty = neg_mark != st.rnd.neg_mark
+            st.rnd.neg_mark = neg_mark
             if action == "start_timer":
                 try:
-                    st.rnd.timer_secs = int(request.form.get("timer", st.rnd.timer_secs))
+                    st.rnd.timer_secs = int(form.get("timer", st.rnd.timer_secs))
                 except: pass
                 st.rnd.deadline = time.time() + st.rnd.timer_secs
+                dirty = True
             elif action == "shuffle":
-                import random
                 random.shuffle(st.questions)
+                for q in st.questions:
+                    q._human = None
                 st.rnd.qidx = 0
                 st.rnd.revealed = False
                 st.rnd.deadline = None
-                for tid in st.teams:
-                    st.rnd.submissions[tid] = {}
+                st.rnd.submissions.clear()
+                dirty = True
             elif action == "prev":
                 st.rnd.qidx = max(0, st.rnd.qidx - 1)
                 st.rnd.revealed = False
                 st.rnd.deadline = None
+                dirty = True
             elif action == "next":
-                st.rnd.qidx = min(len(st.questions)-1, st.rnd.qidx + 1)
+                st.rnd.qidx = min(st._n_q-1, st.rnd.qidx + 1)
                 st.rnd.revealed = False
                 st.rnd.deadline = None
+                dirty = True
             elif action in ("reset_round","reset_all","reveal"):
                 # reveal is allowed; resets are protected
                 if action in ("reset_round","reset_all") and not allowed_reset():
@@ -287,39 +529,43 @@ def facilitator():
                     if action == "reveal":
                         q = current_question(st)
                         if q:
-                            for tid in st.teams:
-                                ans = st.rnd.submissions.get(tid, {}).get(st.rnd.qidx)
-                                if not ans:
-                                    continue
-                                correct = eval_answer(q, ans)
-                                ans.correct = bool(correct)
-                                if correct:
-                                    delta = 1.0 if q.kind == "single" else 2.0
-                                    st.rnd.scores[tid] = st.rnd.scores.get(tid, 0.0) + delta
-                                else:
-                                    if st.rnd.neg_mark and ((q.kind=="single" and ans.choice is not None) or (q.kind=="multi" and (ans.choices or [])) or (q.kind=="short" and (ans.text or ""))):
-                                        st.rnd.scores[tid] = st.rnd.scores.get(tid, 0.0) - 0.5
+                            qidx = st.rnd.qidx
+                            base_delta = 1.0 if q.kind == "single" else 2.0
+                            neg = st.rnd.neg_mark
+                            scores = st.rnd.scores
+                            submissions = st.rnd.submissions
+                            pending = [(tid, ans) for tid in st.teams if (ans := submissions.get((tid, qidx)))]
+                            for tid, ans in pending:
+                                correct = bool(eval_answer(q, ans))
+                                ans.correct = correct
+                                delta = base_delta if correct else (-0.5 if neg and _has_answer(ans, q.kind) else 0.0)
+                                if delta:
+                                    scores[tid] = scores.get(tid, 0.0) + delta
                             st.rnd.revealed = True
                             st.rnd.deadline = None
+                            dirty = True
                     elif action == "reset_round":
                         st.rnd.revealed = False
                         st.rnd.deadline = None
-                        for tid in st.teams:
-                            st.rnd.submissions[tid] = {}
+                        st.rnd.submissions.clear()
+                        dirty = True
                     elif action == "reset_all":
+                        st.rnd.submissions.clear()
                         for tid in st.teams:
-                            st.rnd.submissions[tid] = {}
                             st.rnd.scores[tid] = 0.0
                         st.rnd.qidx = 0
                         st.rnd.revealed = False
                         st.rnd.deadline = None
-            save_state(st)
+                        dirty = True
+            if dirty:
+                st._rev += 1
+                save_state(st)
         q = current_question(st)
         qidx = st.rnd.qidx
-        total = len(st.questions)
+        total = st._n_q
         subs = []
         for tid, team in st.teams.items():
-            ans = st.rnd.submissions.get(tid, {}).get(qidx)
+            ans = st.rnd.submissions.get((tid, qidx))
             if q and ans:
                 if q.kind=="single":
                     atext = q.choices[ans.choice] if ans.choice is not None and 0 <= ans.choice < len(q.choices) else "(no answer)"
@@ -333,7 +579,7 @@ def facilitator():
                 correct = None
             subs.append({"team": team, "answer": atext, "correct": correct})
         answer_human = human_answer(q) if q else None
-        state = st.rnd
+        state = copy.copy(st.rnd)  # template reads only the scalar round fields
         b = board(st)
         admin_required = True if ADMIN_TOKEN else False
     if request.method == "POST" and 'blocked' in locals() and blocked:
@@ -341,6 +587,7 @@ def facilitator():
     return render_template("facilitator.html", q=q, qidx=qidx, total=total, subs=subs, answer_human=answer_human, state=state, board=b, admin_required=admin_required)
 
 @APP.route("/play")
+@cached_page
 def play_all():
     with LOCK:
         st = STATE
@@ -0,0 +1,15 @@
+import pytest
+
+import app.app as m
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point state persistence at a temporary directory."""
+    monkeypatch.setattr(m, "STATE_FILE", str(tmp_path / "state.json"))
+    monkeypatch.setattr(m, "_EVENT_LOG", str(tmp_path / "state.json.log"))
+    monkeypatch.setattr(m, "_LOG_FH", None)
+    monkeypatch.setattr(m, "_LOG_COUNT", 0)
+    yield tmp_path
+    if m._LOG_FH is not None:
+        m._LOG_FH.close()
@@ -0,0 +1,73 @@
+import re
+import types
+
+import pytest
+
+import app.app as m
+
+
+def short(answers):
+    q = m.Question(id="q", kind="short", text="", topic="", difficulty="", answer=answers)
+    m.compile_answers([q])
+    return q
+
+
+def matches(q, text):
+    return m.eval_answer(q, m.Answer(text=text))
+
+
+@pytest.fixture
+def fake_re2(monkeypatch):
+    # stands in for google-re2; records what was handed to it
+    seen = []
+
+    def compile(pattern):
+        seen.append(pattern)
+        return re.compile(pattern)
+
+    monkeypatch.setattr(m, "re2", types.SimpleNamespace(compile=compile))
+    return seen
+
+
+@pytest.fixture
+def no_re2(monkeypatch):
+    monkeypatch.setattr(m, "re2", None)
+
+
+def test_union_still_fullmatches_longer_alternative(no_re2):
+    q = short(["a", "ab"])
+    assert len(q._compiled) == 1
+    assert matches(q, "AB")
+    assert not matches(q, "abc")
+
+
+def test_capture_groups_stay_separate(no_re2):
+    q = short([r"(a)\1", r"(b)\1"])
+    assert len(q._compiled) == 2
+    assert matches(q, "bb")
+
+
+def test_inline_flags_stay_separate(no_re2):
+    q = short(["foo", "(?s)bar"])
+    assert len(q._compiled) == 2
+    assert matches(q, "BAR")
+
+
+def test_no_answers_never_match(no_re2):
+    assert not matches(short([]), "")
+
+
+def test_re2_compiles_plain_union(fake_re2):
+    q = short(["recreate", "rollout restart"])
+    assert fake_re2 == ["(?i)(?:recreate)|(?:rollout restart)"]
+    assert matches(q, "Rollout Restart")
+
+
+@pytest.mark.parametrize("answers, text", [
+    ([r"rollout\s+restart", "recreate"], "rollout\u00a0restart"),
+    ([r"\w+", "x"], "café"),
+])
+def test_re2_skipped_for_unicode_classes(fake_re2, answers, text):
+    q = short(answers)
+    assert fake_re2 == []
+    assert matches(q, text)
@@ -0,0 +1,83 @@
+import orjson
+
+import app.app as m
+
+
+def restart() -> m.RootState:
+    # drop the open log handle the way a process exit would
+    if m._LOG_FH is not None:
+        m._LOG_FH.close()
+        m._LOG_FH = None
+    return m.load_state()
+
+
+def submit(st, team_id, qidx, ans):
+    m.apply_submit(st, team_id, qidx, ans)
+    m.log_event(st, {"t": "submit", "team": team_id, "q": qidx, "ans": m._flat(ans)})
+
+
+def test_replays_log_on_top_of_snapshot(store):
+    st = m.load_state()
+    submit(st, "alpha", 0, m.Answer(choice=1))
+    submit(st, "bravo", 0, m.Answer(choice=2))
+    submit(st, "alpha", 0, m.Answer(choice=3))
+
+    st2 = restart()
+    assert st2.rnd.submissions == {("alpha", 0): m.Answer(choice=3), ("bravo", 0): m.Answer(choice=2)}
+    # replayed events are folded into the snapshot
+    assert (store / "state.json.log").read_bytes() == b""
+    assert restart().rnd.submissions == st2.rnd.submissions
+
+
+def test_ignores_torn_last_line(store):
+    st = m.load_state()
+    submit(st, "alpha", 0, m.Answer(choice=1))
+    m._LOG_FH.write(b'{"t":"submit","team":"bravo","q":0,"ans":{"cho')
+    m._LOG_FH.flush()
+
+    st2 = restart()
+    assert st2.rnd.submissions == {("alpha", 0): m.Answer(choice=1)}
+    # appends after restart are not glued onto the torn fragment
+    submit(st2, "charlie", 0, m.Answer(choice=0))
+    assert set(restart().rnd.submissions) == {("alpha", 0), ("charlie", 0)}
+
+
+def test_skips_events_already_in_snapshot(store):
+    # crash after the snapshot replaced state.json but before the log was truncated
+    st = m.load_state()
+    submit(st, "alpha", 0, m.Answer(choice=1))
+    stale_log = (store / "state.json.log").read_bytes()
+    st.rnd.submissions[("alpha", 0)].correct = True
+    st.rnd.revealed = True
+    m.save_state(st)
+    (store / "state.json.log").write_bytes(stale_log)
+
+    st2 = restart()
+    assert st2.rnd.submissions[("alpha", 0)].correct is True
+    submit(st2, "bravo", 1, m.Answer(choice=0))
+    assert ("bravo", 1) in restart().rnd.submissions
+
+
+def test_legacy_nested_submissions_round_trip(store):
+    st = m.load_state()
+    m.save_state(st)
+    legacy = orjson.loads((store / "state.json").read_bytes())
+    del legacy["log_seq"]
+    legacy["rnd"]["submissions"] = {
+        "alpha": {"0": {"choice": 1, "choices": None, "text": None, "correct": True}},
+        "bravo": {"0": {"choice": None, "choices": None, "text": "x", "correct": None},
+                  "2": {"choice": None, "choices": [0, 1], "text": None, "correct": False}},
+    }
+    (store / "state.json").write_bytes(orjson.dumps(legacy))
+
+    expected = {
+        ("alpha", 0): m.Answer(choice=1, correct=True),
+        ("bravo", 0): m.Answer(text="x"),
+        ("bravo", 2): m.Answer(choices=[0, 1], correct=False),
+    }
+    st2 = restart()
+    assert st2.rnd.submissions == expected
+    m.save_state(st2)
+    saved = orjson.loads((store / "state.json").read_bytes())
+    assert set(saved["rnd"]["submissions"]) == {"alpha|0", "bravo|0", "bravo|2"}
+    assert restart().rnd.submissions == expected
@@ -0,0 +1,117 @@
+import pytest
+
+import app.app as m
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(m, "STATE", m.load_state())
+    monkeypatch.setattr(m, "_PAGE_CACHE", {})
+    return m.APP.test_client()
+
+
+def goto(client, kind):
+    # advance the round to the first question of the given kind
+    m.STATE.rnd.qidx = 0
+    while m.current_question(m.STATE).kind != kind:
+        client.post("/facilitator", data={"action": "next"})
+    return m.current_question(m.STATE)
+
+
+def stored(team_id="alpha"):
+    return m.STATE.rnd.submissions.get((team_id, m.STATE.rnd.qidx))
+
+
+def test_json_submit_single(client):
+    q = goto(client, "single")
+    assert client.post("/t/alpha/submit", json={"choice": q.answer}).status_code == 302
+    assert stored().choice == q.answer
+
+
+def test_json_submit_multi(client):
+    goto(client, "multi")
+    assert client.post("/t/alpha/submit", json={"choices": [0, "1"]}).status_code == 302
+    assert stored().choices == [0, 1]
+
+
+def test_json_submit_short(client):
+    goto(client, "short")
+    assert client.post("/t/alpha/submit", json={"text": "  recreate "}).status_code == 302
+    assert stored().text == "recreate"
+
+
+def test_json_missing_fields_are_empty(client):
+    goto(client, "multi")
+    assert client.post("/t/alpha/submit", json={"choices": None}).status_code == 302
+    assert stored().choices == []
+
+
+@pytest.mark.parametrize("kind, body", [
+    ("single", {"choice": True}),
+    ("single", {"choice": False}),
+    ("single", {"choice": 1.5}),
+    ("multi", {"choices": 5}),
+    ("multi", {"choices": 0}),
+    ("multi", {"choices": False}),
+    ("multi", {"choices": {}}),
+    ("multi", {"choices": "01"}),
+    ("multi", {"choices": [True]}),
+    ("short", {"text": 5}),
+    ("short", {"text": False}),
+])
+def test_json_mistyped_fields_rejected(client, kind, body):
+    goto(client, kind)
+    client.post("/t/alpha/submit", data={"choices": ["0"], "choice": "0", "text": "keep"})
+    before = stored()
+    assert client.post("/t/alpha/submit", json=body).status_code == 400
+    assert stored() == before
+
+
+@pytest.mark.parametrize("raw", [b"{bad", b"[1, 2]"])
+def test_json_malformed_body_rejected(client, raw):
+    goto(client, "single")
+    resp = client.post("/t/alpha/submit", data=raw, content_type="application/json")
+    assert resp.status_code == 400
+    assert stored() is None
+
+
+def test_team_page_counts_current_question_only(client):
+    goto(client, "single")
+    client.post("/t/alpha/submit", data={"choice": "0"})
+    client.post("/t/bravo/submit", data={"choice": "1"})
+    client.post("/facilitator", data={"action": "next"})
+    client.post("/t/charlie/submit", data={"choice": "0"})
+    assert b"Submitted: 1" in client.get("/t/alpha").data
+
+
+def test_reveal_scores_only_current_question(client):
+    q = goto(client, "single")
+    wrong = (q.answer + 1) % len(q.choices)
+    client.post("/t/alpha/submit", data={"choice": str(q.answer)})
+    client.post("/t/bravo/submit", data={"choice": str(wrong)})
+    client.post("/facilitator", data={"action": "reveal", "neg": "on"})
+    scores = m.STATE.rnd.scores
+    assert (scores["alpha"], scores["bravo"], scores["charlie"]) == (1.0, -0.5, 0.0)
+    assert stored("alpha").correct is True and stored("bravo").correct is False
+
+
+@pytest.mark.parametrize("raw", ["²", "x", "-1", ""])
+def test_form_non_ascii_digit_choice_is_no_answer(client, raw):
+    goto(client, "single")
+    assert client.post("/t/alpha/submit", data={"choice": raw}).status_code == 302
+    assert stored().choice is None
+
+
+def test_form_too_many_choices_rejected(client):
+    q = goto(client, "multi")
+    raw = [str(i) for i in range(len(q.choices))]
+    assert client.post("/t/alpha/submit", data={"choices": raw + ["0"]}).status_code == 400
+    assert stored() is None
+    assert client.post("/t/alpha/submit", data={"choices": raw}).status_code == 302
+    assert stored().choices == list(range(len(q.choices)))
+
+
+def test_form_non_numeric_choices_rejected(client):
+    goto(client, "multi")
+    assert client.post("/t/alpha/submit", data={"choices": ["0", "x"]}).status_code == 400
+    assert stored() is None